@@ -1,5 +1,4 @@
 import tkinter as tk
-from datetime import datetime
 import threading
 import time
 import uuid
@@ -8,7 +7,7 @@ import socketio
 import asyncio 
 from queue import Empty
 
-from config_loader import ConfigLoader
+from config_loader import get_config_loader
 from gemini_client import GeminiClient
 from screen_capture import ScreenCapture
 from streaming_manager import StreamingManager
@@ -19,24 +18,28 @@ from config import MICROPHONE_DEVICE_ID, DESKTOP_AUDIO_DEVICE_ID
 
 from openai_realtime_client import OpenAIRealtimeClient
 from transcriber_core.openai_streamer import SmartAudioTranscriber
-from transcript_enricher import TranscriptEnricher
+from transcript_enricher import TranscriptEnricher, SPEAKER_PATTERN
 
 class AppController:
     def __init__(self):
-        self.config = ConfigLoader()
+        self.config = get_config_loader()
         print("Gemini Screen Watcher (Unified Vision+Audio) - Starting up...")
         
         self._shutting_down = False
         self._shutdown_lock = threading.Lock()
+        # Callbacks can fire before the GUI exists (e.g. a GeminiClient init error)
+        self.gui = None
         
         # Audio Device State
         self.current_mic_id = MICROPHONE_DEVICE_ID
         self.current_desktop_id = DESKTOP_AUDIO_DEVICE_ID
+        self._last_meter_levels = {"mic": -1, "desktop": -1}
         
         # --- HUB CLIENT SETUP ---
         # Initializes Socket.IO client to connect to Central Hub on port 8002
         self.sio = socketio.AsyncClient(reconnection=True, reconnection_delay=5)
         self.hub_url = "http://localhost:8002" 
+        self.hub_loop = None  # Created in run()
         
         self.BROADCAST_RAW = False
         
@@ -55,9 +58,14 @@ class AppController:
             self.config.debug_mode,
             audio_sample_rate=self.config.audio_sample_rate
         )
+        # Probe Gemini now so the TLS handshake and round trip overlap the rest
+        # of start-up; the pooled connection is then warm for the first frame
+        self._gemini_check_done = threading.Event()
+        self._gemini_check_result = (False, "Connection check did not complete")
+        threading.Thread(target=self._check_gemini_connection, daemon=True).start()
         
         self.mic_transcriber = MicrophoneTranscriber(keep_files=False, device_id=self.current_mic_id)
-        self.mic_transcriber.set_volume_callback(lambda level: self.gui.set_volume_meter("mic", level))
+        self.mic_transcriber.set_volume_callback(lambda level: self._on_volume_level("mic", level))
         self.mic_polling_active = True
         
         self.streaming_manager = StreamingManager(
@@ -91,7 +99,7 @@ class AppController:
                 self.openai_client, 
                 device_id=self.current_desktop_id
             )
-            self.smart_transcriber.set_volume_callback(lambda level: self.gui.set_volume_meter("desktop", level))
+            self.smart_transcriber.set_volume_callback(lambda level: self._on_volume_level("desktop", level))
             
             self.transcript_enricher = TranscriptEnricher(
                 api_key=self.config.openai_api_key,
@@ -165,13 +173,13 @@ class AppController:
             # text_update ensures the live feed in the UI is updated
             self._emit_to_hub('text_update', {"type": "text_update", "content": final_text})
 
-            if hasattr(self, 'gui') and self.gui:
+            if self.gui:
                 self.gui.add_response(final_text)
             
             # Local legacy broadcast
             self.websocket_server.broadcast({
                 "type": "text_update",
-                "timestamp": datetime.now().isoformat(),
+                "timestamp": time.time(),
                 "content": final_text
             })
             self.current_response_buffer = ""
@@ -211,8 +219,7 @@ class AppController:
         """Handles desktop audio transcripts enriched by GPT-4o."""
         speaker = "Unknown"
         try:
-            import re
-            match = re.search(r'\[\d+:\d+\]\s*(?:\[.*?\]\s*)?([^:(]+?)(?:\s*\([^)]+\))?:', enriched_text)
+            match = SPEAKER_PATTERN.search(enriched_text)
             if match: speaker = match.group(1).strip()
         except: pass
         
@@ -257,7 +264,7 @@ class AppController:
         except: pass
         
         # Shutdown Hub loop thread-safely
-        if hasattr(self, 'hub_loop'):
+        if self.hub_loop:
             self.hub_loop.call_soon_threadsafe(self.hub_loop.stop)
 
         try:
@@ -313,15 +320,21 @@ class AppController:
     def _restart_mic_transcriber(self):
         if self.mic_transcriber: self.mic_transcriber.stop()
         self.mic_transcriber = MicrophoneTranscriber(keep_files=False, device_id=self.current_mic_id)
-        self.mic_transcriber.set_volume_callback(lambda level: self.gui.set_volume_meter("mic", level))
+        self.mic_transcriber.set_volume_callback(lambda level: self._on_volume_level("mic", level))
         threading.Thread(target=self.mic_transcriber.run, daemon=True).start()
 
     def _restart_desktop_transcriber(self):
         if not self.smart_transcriber: return
-        self.smart_transcriber.stop()
-        self.smart_transcriber = SmartAudioTranscriber(self.openai_client, device_id=self.current_desktop_id)
-        self.smart_transcriber.set_volume_callback(lambda level: self.gui.set_volume_meter("desktop", level))
-        self.smart_transcriber.start()
+        # Only the capture stream changes; the Realtime connection is kept
+        self.smart_transcriber.switch_device(self.current_desktop_id)
+
+    def _on_volume_level(self, source, level):
+        """Quantizes levels to the 60 px meter and only forwards changes."""
+        quantized = int(min(max(level, 0.0), 1.0) * 60)
+        if quantized == self._last_meter_levels[source]:
+            return
+        self._last_meter_levels[source] = quantized
+        if self.gui: self.gui.set_volume_meter(source, quantized / 60)
 
     def gui_update_wrapper(self, frame):
         if self.gui: self.gui.update_preview(frame)
@@ -332,21 +345,28 @@ class AppController:
             self.transcript_enricher.enrich(transcript)
 
     def _on_openai_error(self, error_msg):
-        if hasattr(self, 'gui') and self.gui: self.gui.add_error(f"OpenAI Error: {error_msg}")
+        if self.gui: self.gui.add_error(f"OpenAI Error: {error_msg}")
 
     def _on_gemini_error(self, error_message):
-        if hasattr(self, 'gui') and self.gui: self.gui.add_error(f"Gemini API Error: {error_message}")
+        if self.gui: self.gui.add_error(f"Gemini API Error: {error_message}")
 
     def _on_streaming_error(self, error_message):
-        if hasattr(self, 'gui') and self.gui: self.gui.add_error(f"Streaming Error: {error_message}")
+        if self.gui: self.gui.add_error(f"Streaming Error: {error_message}")
+
+    def _check_gemini_connection(self):
+        try:
+            self._gemini_check_result = self.gemini_client.test_connection()
+        finally:
+            self._gemini_check_done.set()
 
     def _start_stream_on_init(self):
         if not self.screen_capture.is_ready():
             self.gui.update_status("Cannot start. No source.", "red")
             return
         def run_check():
-            ok, msg = self.gemini_client.test_connection()
-            self.gui.root.after(0, self._finalize_start, ok, msg)
+            self._gemini_check_done.wait()
+            ok, msg = self._gemini_check_result
+            self.gui.call_soon(lambda: self._finalize_start(ok, msg))
         self.gui.update_status("Checking API...", "orange")
         threading.Thread(target=run_check, daemon=True).start()
 
@@ -365,4 +385,4 @@ class AppController:
         if self.config.capture_region: self.screen_capture.set_capture_region(self.config.capture_region)
 
     def get_prompt(self): return self.config.prompt
-    def get_timestamp(self): return datetime.now().strftime("%I:%M:%S %p")
\ No newline at end of file
+    def get_timestamp(self): return time.strftime("%I:%M:%S %p", time.localtime())
\ No newline at end of file
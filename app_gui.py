@@ -1,6 +1,11 @@
 import tkinter as tk
+import queue
+import threading
+from collections import deque
 from tkinter import scrolledtext, font, ttk 
 from PIL import ImageTk, Image # type: ignore
+import cv2 # type: ignore
+import numpy as np # type: ignore
 
 class AppGUI:
     def __init__(self, controller):
@@ -13,6 +18,10 @@ class AppGUI:
         self.default_font.configure(family="Helvetica", size=11)
         
         self.root.protocol("WM_DELETE_WINDOW", self.controller.stop)
+
+        # All cross-thread updates are queued here and applied by a single _pump loop
+        self._ui_queue = queue.Queue()
+        self._pump_interval = 16
         
         # --- Top Frame ---
         top_frame = tk.Frame(self.root, bg="#2E2E2E", padx=10, pady=10)
@@ -29,9 +38,10 @@ class AppGUI:
         self.combo_mic.pack(side=tk.LEFT, padx=(0, 5))
         self.combo_mic.bind("<<ComboboxSelected>>", self.controller.on_mic_changed)
         
-        self.mic_meter = tk.Canvas(settings_frame, width=60, height=15, bg="#1E1E1E", highlightthickness=0)
+        self.mic_meter = tk.Frame(settings_frame, width=60, height=15, bg="#1E1E1E")
         self.mic_meter.pack(side=tk.LEFT, padx=(0, 15))
-        self.mic_bar = self.mic_meter.create_rectangle(0, 0, 0, 15, fill="#4CAF50")
+        self.mic_bar = tk.Frame(self.mic_meter, bg="#4CAF50", height=15)
+        self.mic_bar.place(x=0, y=0, width=0, height=15)
 
         # Desktop Selection & Volume Meter
         tk.Label(settings_frame, text="🔊 Desktop:", bg="#3E3E3E", fg="white").pack(side=tk.LEFT, padx=(0, 5))
@@ -39,10 +49,16 @@ class AppGUI:
         self.combo_desktop = ttk.Combobox(settings_frame, textvariable=self.desktop_var, state="readonly", width=25)
         self.combo_desktop.pack(side=tk.LEFT, padx=(0, 5))
         self.combo_desktop.bind("<<ComboboxSelected>>", self.controller.on_desktop_changed)
+        self._last_devices = None
 
-        self.desktop_meter = tk.Canvas(settings_frame, width=60, height=15, bg="#1E1E1E", highlightthickness=0)
+        self.desktop_meter = tk.Frame(settings_frame, width=60, height=15, bg="#1E1E1E")
         self.desktop_meter.pack(side=tk.LEFT, padx=(0, 15))
-        self.desktop_bar = self.desktop_meter.create_rectangle(0, 0, 0, 15, fill="#2196F3")
+        self.desktop_bar = tk.Frame(self.desktop_meter, bg="#2196F3", height=15)
+        self.desktop_bar.place(x=0, y=0, width=0, height=15)
+        # Last scheduled bar width per source, so unchanged levels skip the Tk call.
+        # Tracked at enqueue time: the pump keeps only the newest task per source,
+        # so comparing against what was queued last never drops a change
+        self._meter_widths = {"mic": 0, "desktop": 0}
 
         # Refresh Button
         self.btn_refresh = tk.Label(
@@ -70,6 +86,13 @@ class AppGUI:
         
         self.preview_label = tk.Label(self.preview_frame, bg="black", text="Waiting for stream...", fg="gray", font=("Helvetica", 14))
         self.preview_label.pack(expand=True, fill=tk.BOTH)
+        # Capture dims rarely change, so the scaled size and PhotoImage are reused
+        self._preview_src_size = None
+        self._preview_size = None
+        self._preview_photo = None
+        # Frames are resized off the Tk thread; only the newest pending frame is kept
+        self._preview_in = queue.Queue(maxsize=1)
+        threading.Thread(target=self._preview_worker, daemon=True).start()
         
         # --- Main Content ---
         main_frame = tk.Frame(self.root, bg="#2E2E2E", padx=10)
@@ -82,6 +105,16 @@ class AppGUI:
         
         self.feed_text = scrolledtext.ScrolledText(main_frame, wrap=tk.WORD, state=tk.DISABLED, bg="#1E1E1E", fg="#E0E0E0", font=("Helvetica", 12))
         self.feed_text.grid(row=1, column=0, sticky="nsew")
+        # Named font objects so Tk keeps one font handle instead of resolving a tuple
+        self.timestamp_font = font.Font(family="Helvetica", size=10, slant="italic")
+        self.feed_text.tag_config("timestamp", foreground="#BB86FC", font=self.timestamp_font)
+        self.feed_text.tag_config("separator", foreground="#03A9F4", justify='center')
+        # Feed is appended at the end and trimmed from the top so inserts stay cheap
+        self._max_lines = 2000
+        self._separator_text = f"\n{'─' * 80}\n\n"
+        # Entries that arrive while the window is minimized are inserted on <Map>
+        self._pending_feed = deque(maxlen=self._max_lines // 2)
+        self.root.bind("<Map>", self._flush_pending_feed)
         
         self.error_text = scrolledtext.ScrolledText(main_frame, wrap=tk.WORD, state=tk.DISABLED, bg="#1E1E1E", fg="#FF7B7B", height=5)
         self.error_text.grid(row=2, column=0, sticky="nsew", pady=(10, 0))
@@ -97,74 +130,161 @@ class AppGUI:
 
     def set_volume_meter(self, source, level):
         """Updates the visual level meter (0.0 to 1.0)"""
+        width = int(level * 60)
+        if width == self._meter_widths[source]:
+            return
+        self._meter_widths[source] = width
         def _task():
-            canvas = self.mic_meter if source == "mic" else self.desktop_meter
             bar = self.mic_bar if source == "mic" else self.desktop_bar
-            width = int(level * 60)
-            canvas.coords(bar, 0, 0, width, 15)
-        self.root.after(0, _task)
+            bar.place_configure(width=width)
+        self._schedule(_task, key=("meter", source))
 
     def update_preview(self, pil_image):
-        def _task():
-            base_height = 300
-            w_percent = (base_height / float(pil_image.size[1]))
-            w_size = int((float(pil_image.size[0]) * float(w_percent)))
-            img_resized = pil_image.resize((w_size, base_height), Image.Resampling.LANCZOS)
-            photo = ImageTk.PhotoImage(img_resized)
-            self.preview_label.config(image=photo, text="")
-            self.preview_label.image = photo 
-        self.root.after(0, _task)
+        try:
+            self._preview_in.put_nowait(pil_image)
+        except queue.Full:
+            # Drop the stale frame in favour of the newest one
+            try:
+                self._preview_in.get_nowait()
+            except queue.Empty:
+                pass
+            try:
+                self._preview_in.put_nowait(pil_image)
+            except queue.Full:
+                pass
+
+    def _preview_worker(self):
+        """Resizes preview frames in the background and hands them to the Tk thread."""
+        while True:
+            pil_image = self._preview_in.get()
+            try:
+                if pil_image.size != self._preview_src_size:
+                    base_height = 300
+                    w_percent = (base_height / float(pil_image.size[1]))
+                    w_size = int((float(pil_image.size[0]) * float(w_percent)))
+                    self._preview_src_size = pil_image.size
+                    self._preview_size = (w_size, base_height)
+                # INTER_AREA is the right filter for a downscale and much cheaper than Lanczos
+                img_resized = Image.fromarray(cv2.resize(np.asarray(pil_image), self._preview_size, interpolation=cv2.INTER_AREA))
+            except Exception as e:
+                print(f"Preview resize error: {e}")
+                continue
+            self._schedule(lambda img=img_resized: self._show_preview(img), key="preview")
+
+    def _show_preview(self, img_resized):
+        # PhotoImage must be created and updated on the Tk thread
+        if self._preview_photo is None or self._preview_photo.width() != img_resized.width:
+            self._preview_photo = ImageTk.PhotoImage(img_resized)
+            self.preview_label.config(image=self._preview_photo, text="")
+            self.preview_label.image = self._preview_photo
+        else:
+            self._preview_photo.paste(img_resized)
 
     def run(self):
         self.root.after(100, self.controller.update_websocket_gui_status)
+        self.root.after(self._pump_interval, self._pump)
         self.root.mainloop()
 
+    def call_soon(self, task, key=None):
+        """Runs task on the Tk thread; safe to call from any thread."""
+        self._schedule(task, key)
+
+    def _schedule(self, task, key=None):
+        """Queues a task for the Tk thread. Keyed tasks only keep the latest per key."""
+        self._ui_queue.put((key, task))
+
+    def _pump(self):
+        """Applies all queued updates in one pass, then re-arms itself."""
+        with self._ui_queue.mutex:
+            items = list(self._ui_queue.queue)
+            self._ui_queue.queue.clear()
+        tasks = []
+        latest = {}
+        for key, task in items:
+            if key is None:
+                tasks.append(task)
+            else:
+                latest[key] = task
+        for task in tasks + list(latest.values()):
+            try:
+                task()
+            except Exception as e:
+                print(f"GUI update error: {e}")
+        self.root.after(self._pump_interval, self._pump)
+
     def add_response(self, text):
         def _task():
-            self.feed_text.configure(state=tk.NORMAL)
             timestamp = self.controller.get_timestamp()
-            self.feed_text.insert('1.0', f"{text}\n\n", "response")
-            self.feed_text.insert('1.0', f"--- {timestamp} ---\n", "timestamp")
-            self.feed_text.configure(state=tk.DISABLED)
-            self.feed_text.tag_config("timestamp", foreground="#BB86FC", font=("Helvetica", 10, "italic"))
-        self.root.after(0, _task)
+            self._append_feed((f"--- {timestamp} ---\n", "timestamp", f"{text}\n\n", "response"))
+        self._schedule(_task)
 
     def add_reset_separator(self):
         def _task():
-            self.feed_text.configure(state=tk.NORMAL)
-            self.feed_text.insert('1.0', f"\n{'─' * 80}\n\n", "separator")
-            self.feed_text.configure(state=tk.DISABLED)
-            self.feed_text.tag_config("separator", foreground="#03A9F4", justify='center')
-        self.root.after(0, _task)
+            self._append_feed((self._separator_text, "separator"))
+        self._schedule(_task)
+
+    def _append_feed(self, chunks):
+        """Appends (text, tag, ...) chunks to the feed, or holds them while minimized."""
+        if self.root.state() == "iconic":
+            self._pending_feed.append(chunks)
+            return
+        # Only follow new entries if the user has not scrolled up to read
+        at_bottom = self.feed_text.yview()[1] == 1.0
+        self.feed_text.configure(state=tk.NORMAL)
+        self.feed_text.insert(tk.END, *chunks)
+        self._trim_feed()
+        self.feed_text.configure(state=tk.DISABLED)
+        if at_bottom:
+            self.feed_text.see(tk.END)
+
+    def _flush_pending_feed(self, event):
+        # <Map> on the root is also delivered for every child widget
+        if event.widget is not self.root or not self._pending_feed:
+            return
+        chunks = tuple(part for entry in self._pending_feed for part in entry)
+        self._pending_feed.clear()
+        self._append_feed(chunks)
+
+    def _trim_feed(self):
+        """Drops the oldest lines once the feed exceeds _max_lines."""
+        line_count = int(self.feed_text.index('end-1c').split('.')[0])
+        if line_count > self._max_lines:
+            self.feed_text.delete('1.0', f"{line_count - self._max_lines + 1}.0")
 
     def add_error(self, text):
         def _task():
+            # Appended oldest-first like the feed, following only when already at the bottom
+            at_bottom = self.error_text.yview()[1] == 1.0
             self.error_text.configure(state=tk.NORMAL)
             timestamp = self.controller.get_timestamp()
-            self.error_text.insert('1.0', f"[{timestamp}] {text}\n")
+            self.error_text.insert(tk.END, f"[{timestamp}] {text}\n")
             self.error_text.configure(state=tk.DISABLED)
-        self.root.after(0, _task)
+            if at_bottom:
+                self.error_text.see(tk.END)
+        self._schedule(_task)
 
     def update_status(self, message, color="white"):
         def _task():
             self.status_label.config(text=f"Status: {message}", fg=color)
-        self.root.after(0, _task)
+        self._schedule(_task, key="status")
 
     def update_websocket_status(self, message, color="white"):
         def _task():
             self.websocket_status_label.config(text=f"WebSocket: {message}", fg=color)
-        self.root.after(0, _task)
+        self._schedule(_task, key="websocket_status")
         
     def set_device_lists(self, mic_list, desktop_list, current_mic_idx, current_desktop_idx):
+        devices = (tuple(mic_list), tuple(desktop_list), current_mic_idx, current_desktop_idx)
+        if devices == self._last_devices:
+            return
+        self._last_devices = devices
         def _task():
             self.combo_mic['values'] = mic_list
             self.combo_desktop['values'] = desktop_list
-            for item in mic_list:
-                if item.startswith(f"{current_mic_idx}:"):
-                    self.combo_mic.set(item)
-                    break
-            for item in desktop_list:
-                if item.startswith(f"{current_desktop_idx}:"):
-                    self.combo_desktop.set(item)
-                    break
-        self.root.after(0, _task)
\ No newline at end of file
+            mic_by_idx = {item.split(":", 1)[0]: item for item in mic_list}
+            desktop_by_idx = {item.split(":", 1)[0]: item for item in desktop_list}
+            if str(current_mic_idx) in mic_by_idx:
+                self.combo_mic.set(mic_by_idx[str(current_mic_idx)])
+            if str(current_desktop_idx) in desktop_by_idx:
+                self.combo_desktop.set(desktop_by_idx[str(current_desktop_idx)])
+        self._schedule(_task, key="devices")
\ No newline at end of file
@@ -1,52 +1,91 @@
 """
 Configuration loader for Screen Watcher
 """
+import functools
+import os
+from collections.abc import Mapping
+from dataclasses import dataclass, field, fields
 
+@dataclass(frozen=True, slots=True)
 class ConfigLoader:
-    def __init__(self):
-        self.api_key = ""
-        self.openai_api_key = ""  # New field
-        self.capture_region = None
-        self.fps = 2
-        self.image_quality = 85
-        self.prompt = ""
-        self.safety_settings = None
-        self.max_output_tokens = 500
-        self.debug_mode = False
-        self.audio_sample_rate = 16000
-        self.audio_device_id = 0
-        self.video_device_index = None
-        
-        self._load_config()
-    
-    def _load_config(self):
+    # Keys are kept out of the generated __repr__
+    api_key: str = field(default="", repr=False)
+    openai_api_key: str = field(default="", repr=False)
+    capture_region: Mapping | None = None
+    fps: float = 2
+    image_quality: int = 85
+    safety_settings: tuple | None = None
+    max_output_tokens: int = 500
+    debug_mode: bool = False
+    audio_sample_rate: int = 16000
+    audio_device_id: int = 0
+    video_device_index: int | None = None
+    # Profile in prompts.py; None only when config.py is missing
+    prompt_profile: str | None = None
+    # A PROMPT defined in config.py takes precedence over the profile
+    custom_prompt: str | None = field(default=None, repr=False)
+    # Backing store for lazily computed values (slots rule out cached_property)
+    _cache: dict = field(default_factory=dict, init=False, repr=False, compare=False)
+
+    # config.py names that are not simply the upper-cased field name
+    _CONFIG_NAMES = {'audio_device_id': 'DESKTOP_AUDIO_DEVICE_ID', 'custom_prompt': 'PROMPT'}
+
+    @classmethod
+    def from_module(cls):
+        """Builds a loader from config.py; missing names keep their defaults."""
         try:
             import config
-            self.api_key = getattr(config, 'API_KEY', "")
-            self.openai_api_key = getattr(config, 'OPENAI_API_KEY', "") # Load OpenAI Key
-            self.capture_region = getattr(config, 'CAPTURE_REGION', None)
-            self.fps = getattr(config, 'FPS', 2)
-            self.image_quality = getattr(config, 'IMAGE_QUALITY', 85)
-            self.prompt = getattr(config, 'PROMPT', "")
-            self.safety_settings = getattr(config, 'SAFETY_SETTINGS', None)
-            self.max_output_tokens = getattr(config, 'MAX_OUTPUT_TOKENS', 500)
-            self.debug_mode = getattr(config, 'DEBUG_MODE', False)
-            self.audio_sample_rate = getattr(config, 'AUDIO_SAMPLE_RATE', 16000)
-            self.audio_device_id = getattr(config, 'DESKTOP_AUDIO_DEVICE_ID', 0)
-            self.video_device_index = getattr(config, 'VIDEO_DEVICE_INDEX', None)
-            
+            cfg = vars(config)
         except ImportError:
             print("Warning: config.py not found. Using default settings.")
-    
+            return cls()
+        values = {}
+        for f in fields(cls):
+            if not f.init:
+                continue
+            name = cls._CONFIG_NAMES.get(f.name, f.name.upper())
+            if name in cfg:
+                values[f.name] = cfg[name]
+        # Older config.py files predate PROMPT_PROFILE
+        values.setdefault('prompt_profile', 'default')
+        return cls(**values)
+
+    @property
+    def prompt(self):
+        """Prompt text; prompts.py is only imported and rendered on first access."""
+        if 'prompt' not in self._cache:
+            self._cache['prompt'] = self._load_prompt()
+        return self._cache['prompt']
+
+    def _load_prompt(self):
+        if self.custom_prompt is not None:
+            prompt = self.custom_prompt
+        elif self.prompt_profile is None:
+            prompt = ""
+        else:
+            from prompts import render_prompt
+            profile = os.environ.get("SCREEN_WATCHER_PROFILE", self.prompt_profile)
+            # Transcripts are sent with each frame, so the system prompt points there
+            prompt = render_prompt(profile, "(Provided with each frame under RECENT AUDIO LOGS.)")
+        if not prompt:
+            print("Warning: prompt is empty. Gemini will run without a system instruction.")
+        return prompt
+
     def is_api_key_configured(self):
         return bool(self.api_key)
 
     def is_openai_key_configured(self):
         return bool(self.openai_api_key)
-    
+
     def get_region_description(self):
         if self.video_device_index is not None:
             return f"Camera Device Index: {self.video_device_index}"
         if self.capture_region:
             return f"{self.capture_region['width']}x{self.capture_region['height']} at ({self.capture_region['left']}, {self.capture_region['top']})"
-        return "Will select during startup"
\ No newline at end of file
+        return "Will select during startup"
+
+
+@functools.lru_cache(maxsize=1)
+def get_config_loader():
+    """Returns the process-wide ConfigLoader, loading config.py only once."""
+    return ConfigLoader.from_module()
@@ -3,17 +3,38 @@ from google.genai import types
 import threading
 import time
 import cv2
+import numpy as np
 from PIL import Image
 import io
+try:
+    # libjpeg-turbo with SIMD DCT; encodes BGR/RGB arrays without a PIL copy
+    import simplejpeg # type: ignore
+except ImportError:
+    simplejpeg = None
+
+# Used when config.py provides no SAFETY_SETTINGS
+DEFAULT_SAFETY_SETTINGS = tuple(
+    {"category": category, "threshold": "BLOCK_NONE"}
+    for category in (
+        "HARM_CATEGORY_HARASSMENT",
+        "HARM_CATEGORY_HATE_SPEECH",
+        "HARM_CATEGORY_SEXUALLY_EXPLICIT",
+        "HARM_CATEGORY_DANGEROUS_CONTENT",
+    )
+)
 
 class GeminiClient:
-    def __init__(self, api_key, system_prompt, safety_settings, response_callback, error_callback, max_output_tokens=500, debug_mode=False, audio_sample_rate=None):
+    def __init__(self, api_key, system_prompt, safety_settings, response_callback, error_callback, max_output_tokens=500, debug_mode=False, audio_sample_rate=None, max_edge=1024):
         self.api_key = api_key
         self.system_prompt = system_prompt
         self.response_callback = response_callback
         self.error_callback = error_callback
         self.debug_mode = debug_mode
         self.max_output_tokens = max_output_tokens
+        # Longest side of an uploaded frame; larger frames are downscaled first
+        self.max_edge = max_edge
+        # Shared read-only settings from config; no per-client copy is made
+        self.safety_settings = safety_settings or DEFAULT_SAFETY_SETTINGS
 
         # 1. Initialize the V2 Client
         self.client = genai.Client(api_key=self.api_key)
@@ -21,13 +42,27 @@ class GeminiClient:
         # 2. Model Configuration
         self.model_name = "gemini-2.5-flash" 
         
-        # 3. Create a Chat Session (Stateful)
-        # The new SDK handles config inside the chat creation or per message
+        # 3. Build the chat config once; it is reused every time the chat is reset
+        self._chat_config = types.GenerateContentConfig(
+            system_instruction=self.system_prompt,
+            temperature=0.7,
+            max_output_tokens=self.max_output_tokens,
+            safety_settings=[types.SafetySetting(**setting) for setting in self.safety_settings]
+        )
+
+        # 4. Create a Chat Session (Stateful)
         self._init_chat()
 
+        # Past exchanges (a user frame plus the model's reply) kept, as text only,
+        # in the chat history
+        self.max_history_exchanges = 20
+        self._frame_marker = types.Part.from_text(text="[earlier screen frame]")
+
         # Concurrency Control
         self._is_processing = False
         self._lock = threading.Lock()
+        # Latest frame waiting for the in-flight request; newer frames replace it
+        self._pending = None
 
     def _init_chat(self):
         """Initializes or resets the chat session."""
@@ -35,29 +70,7 @@ class GeminiClient:
             # Create a chat session with system instructions
             self.chat = self.client.chats.create(
                 model=self.model_name,
-                config=types.GenerateContentConfig(
-                    system_instruction=self.system_prompt,
-                    temperature=0.7,
-                    max_output_tokens=self.max_output_tokens,
-                    safety_settings=[
-                        types.SafetySetting(
-                            category="HARM_CATEGORY_HARASSMENT",
-                            threshold="BLOCK_NONE"
-                        ),
-                        types.SafetySetting(
-                            category="HARM_CATEGORY_HATE_SPEECH",
-                            threshold="BLOCK_NONE"
-                        ),
-                        types.SafetySetting(
-                            category="HARM_CATEGORY_SEXUALLY_EXPLICIT",
-                            threshold="BLOCK_NONE"
-                        ),
-                        types.SafetySetting(
-                            category="HARM_CATEGORY_DANGEROUS_CONTENT",
-                            threshold="BLOCK_NONE"
-                        ),
-                    ]
-                )
+                config=self._chat_config
             )
         except Exception as e:
             if self.error_callback:
@@ -71,10 +84,17 @@ class GeminiClient:
             if self.debug_mode:
                 print(f"GeminiClient: Testing connection to {self.model_name}...")
             
-            # Simple stateless call to check credentials
+            # Simple stateless call to check credentials. It goes through the same
+            # genai.Client as the chat, so the pooled HTTPS connection it opens is
+            # reused by the first frame. Thinking is off and output capped so the
+            # probe returns quickly.
             response = self.client.models.generate_content(
                 model=self.model_name,
-                contents="Reply with 'OK' if you receive this."
+                contents="Reply with 'OK' if you receive this.",
+                config=types.GenerateContentConfig(
+                    max_output_tokens=16,
+                    thinking_config=types.ThinkingConfig(thinking_budget=0)
+                )
             )
             
             if response and response.text:
@@ -86,31 +106,51 @@ class GeminiClient:
 
     def send_message(self, frame, text_prompt=None):
         """
-        Sends an image + context to the chat model.
+        Sends an image + context to the chat model. The frame may be a PIL
+        image or a BGR array.
         """
-        if self._is_processing:
-            if self.debug_mode:
-                print("GeminiClient: Skipped frame (API Busy)")
-            return
-
-        threading.Thread(target=self._process_request, args=(frame, text_prompt), daemon=True).start()
-
-    def _process_request(self, frame, text_prompt):
         with self._lock:
+            if self._is_processing:
+                # Keep only the newest frame, but carry the older frame's audio context
+                if self._pending is not None:
+                    if self.debug_mode:
+                        print("GeminiClient: Dropped superseded frame (API Busy)")
+                    older_prompt = self._pending[1]
+                    if older_prompt:
+                        text_prompt = older_prompt + (text_prompt or "")
+                self._pending = (frame, text_prompt)
+                return
             self._is_processing = True
 
+        threading.Thread(target=self._run_requests, args=(frame, text_prompt), daemon=True).start()
+
+    def _run_requests(self, frame, text_prompt):
+        """Sends a frame, then any frame that arrived meanwhile, until none is left."""
         try:
-            # 1. Convert Frame to Bytes (JPEG)
-            # The new SDK works best with explicit Part types
-            if hasattr(frame, 'shape'): 
-                rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-                pil_image = Image.fromarray(rgb_frame)
-            else:
-                pil_image = frame
+            while True:
+                self._process_request(frame, text_prompt)
+                with self._lock:
+                    if self._pending is None:
+                        # Cleared under the same lock that found no pending frame,
+                        # so a frame parked just now is never lost
+                        self._is_processing = False
+                        return
+                    frame, text_prompt = self._pending
+                    self._pending = None
+        except BaseException:
+            # Something escaped _process_request; free the client so later
+            # frames start a new worker instead of parking in _pending forever
+            with self._lock:
+                self._is_processing = False
+                self._pending = None
+            raise
 
-            img_byte_arr = io.BytesIO()
-            pil_image.save(img_byte_arr, format='JPEG', quality=80)
-            img_bytes = img_byte_arr.getvalue()
+    def _process_request(self, frame, text_prompt):
+        try:
+            # 1. Convert Frame to Bytes (JPEG)
+            # The new SDK works best with explicit Part types; it base64-encodes
+            # the bytes once when serializing.
+            img_bytes = self._encode_jpeg(frame)
 
             # 2. Build Content Parts
             parts = []
@@ -138,16 +178,85 @@ class GeminiClient:
                     if self.response_callback:
                         self.response_callback(chunk.text)
 
+            # 4. Keep only text in the history so the next request uploads one frame
+            self._drop_history_images()
+
         except Exception as e:
             print(f"GeminiClient Error: {e}")
             if self.error_callback:
                 self.error_callback(str(e))
-        
-        finally:
-            with self._lock:
-                self._is_processing = False
+
+    def _encode_jpeg(self, frame):
+        """JPEG bytes for a BGR array or PIL image, via simplejpeg when installed."""
+        if hasattr(frame, 'shape'):
+            h, w = frame.shape[:2]
+            scale = self.max_edge / max(h, w)
+            if scale < 1.0:
+                # INTER_AREA averages source pixels, the right filter for shrinking
+                frame = cv2.resize(frame, (int(w * scale), int(h * scale)), interpolation=cv2.INTER_AREA)
+            if simplejpeg is not None:
+                return simplejpeg.encode_jpeg(
+                    np.ascontiguousarray(frame), quality=80, colorspace='BGR', fastdct=True
+                )
+            # OpenCV encodes BGR natively, so no RGB copy or PIL image is made
+            ok, buf = cv2.imencode('.jpg', frame, [int(cv2.IMWRITE_JPEG_QUALITY), 80])
+            if not ok:
+                raise ValueError("cv2.imencode failed to encode frame")
+            return buf.tobytes()
+        scale = self.max_edge / max(frame.size)
+        if scale < 1.0:
+            # resize returns a new image; the caller's frame may still be on screen
+            frame = frame.resize(
+                (int(frame.width * scale), int(frame.height * scale)), Image.Resampling.BOX
+            )
+        if simplejpeg is not None and frame.mode == 'RGB':
+            # Captured frames are RGB PIL images; no colour conversion is needed
+            return simplejpeg.encode_jpeg(
+                np.asarray(frame), quality=80, colorspace='RGB', fastdct=True
+            )
+
+        img_byte_arr = io.BytesIO()
+        frame.save(img_byte_arr, format='JPEG', quality=80)
+        return img_byte_arr.getvalue()
+
+    def _drop_history_images(self):
+        """
+        The chat resends its whole history with every message. Rebuild it with
+        the image parts swapped for a text marker (the model's own descriptions
+        stay), trimmed to the last max_history_exchanges user turns.
+        """
+        # Under the lock so a reset_chat() from the GUI thread cannot be
+        # overwritten by a rebuild of the old history
+        with self._lock:
+            history = []
+            for content in self.chat.get_history():
+                # A marker replaces each image so user/model turns keep alternating
+                parts = [
+                    self._frame_marker if part.inline_data else part
+                    for part in (content.parts or [])
+                ]
+                if not parts:
+                    continue
+                # Streaming records every chunk as its own model Content; fold them
+                # back into one reply so a trim never cuts a reply in half
+                if content.role == "model" and history and history[-1].role == "model":
+                    history[-1].parts.extend(parts)
+                else:
+                    history.append(types.Content(role=content.role, parts=parts))
+            user_turns = [i for i, content in enumerate(history) if content.role == "user"]
+            # Starting at a user turn also keeps the history opening with one
+            if user_turns:
+                history = history[user_turns[max(0, len(user_turns) - self.max_history_exchanges)]:]
+            else:
+                history = []
+            self.chat = self.client.chats.create(
+                model=self.model_name,
+                config=self._chat_config,
+                history=history
+            )
 
     def reset_chat(self):
-        self._init_chat()
+        with self._lock:
+            self._init_chat()
         if self.debug_mode:
             print("GeminiClient: Chat history reset.")
\ No newline at end of file
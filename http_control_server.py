@@ -18,13 +18,19 @@ CONTROL_PORT = 8007
 _shutdown_callback = None
 _server: HTTPServer | None = None
 
+# Every reply body is fixed, so each is encoded once
+_HEALTH = json.dumps(
+    {"status": "ok", "service": "desktop_monitor", "port": CONTROL_PORT}, separators=(",", ":")
+).encode()
+_SHUTTING_DOWN = json.dumps({"status": "shutting_down"}, separators=(",", ":")).encode()
+_NOT_FOUND = json.dumps({"error": "not found"}, separators=(",", ":")).encode()
+
 
 class _Handler(BaseHTTPRequestHandler):
     def log_message(self, fmt, *args):
         pass  # silence default access logs
 
-    def _send_json(self, code: int, body: dict):
-        payload = json.dumps(body).encode()
+    def _send_json(self, code: int, payload: bytes):
         self.send_response(code)
         self.send_header("Content-Type", "application/json")
         self.send_header("Content-Length", str(len(payload)))
@@ -33,18 +39,18 @@ class _Handler(BaseHTTPRequestHandler):
 
     def do_GET(self):
         if self.path == "/health":
-            self._send_json(200, {"status": "ok", "service": "desktop_monitor", "port": CONTROL_PORT})
+            self._send_json(200, _HEALTH)
         else:
-            self._send_json(404, {"error": "not found"})
+            self._send_json(404, _NOT_FOUND)
 
     def do_POST(self):
         if self.path == "/shutdown":
-            self._send_json(200, {"status": "shutting_down"})
+            self._send_json(200, _SHUTTING_DOWN)
             if _shutdown_callback:
                 # Schedule via tkinter so it runs on the main thread
                 threading.Thread(target=_shutdown_callback, daemon=True).start()
         else:
-            self._send_json(404, {"error": "not found"})
+            self._send_json(404, _NOT_FOUND)
 
 
 def start(shutdown_callback):
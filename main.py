@@ -4,6 +4,7 @@ Gemini Screen Watcher - Main Entry Point
 """
 import sys
 import os
+import asyncio
 import signal
 import threading
 
@@ -26,9 +27,22 @@ def _shutdown(*_):
         _app.stop()
 
 
+def _install_uvloop():
+    """
+    Use uvloop for every event loop the app creates (hub client, OpenAI
+    Realtime, broadcast server). Optional; not available on Windows.
+    """
+    try:
+        import uvloop  # type: ignore
+    except ImportError:
+        return
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
+
 def main():
     global _app
 
+    _install_uvloop()
     _app = AppController()
 
     # Start the HTTP control server so the launcher can health-check and
@@ -1,10 +1,58 @@
 import asyncio
-import json
+import orjson # type: ignore
 import websockets # type: ignore
-import base64
+try:
+    import pybase64 as base64  # type: ignore  # SIMD encoder, same API
+except ImportError:
+    import base64
 import logging
+import random
+import ssl
 from difflib import SequenceMatcher
 
+logger = logging.getLogger(__name__)
+
+# Shared across connections so the CA store is loaded once, not per connect.
+# No ALPN: the websocket upgrade needs HTTP/1.1.
+_SSL_CONTEXT = ssl.create_default_context()
+_SSL_CONTEXT.minimum_version = ssl.TLSVersion.TLSv1_3
+
+# Event types _handle_message acts on, quoted as they appear in the raw frame.
+# Anything else (audio deltas, response events) is skipped before parsing.
+_HANDLED_EVENTS = (
+    b'"conversation.item.input_audio_transcription.completed"',
+    b'"input_audio_buffer.speech_stopped"',
+    b'"input_audio_buffer.committed"',
+    b'"error"',
+)
+
+# Constant for every session, so it is encoded once at import. Kept as UTF-8
+# bytes and sent with text=True, so websockets does not re-encode them per send
+_SESSION_UPDATE = orjson.dumps({
+    "type": "session.update",
+    "session": {
+        "modalities": ["text", "audio"],
+        "input_audio_format": "pcm16",
+        "input_audio_transcription": {
+            "model": "whisper-1",
+            "language": "en"
+        },
+        "turn_detection": {
+            "type": "server_vad",
+            "threshold": 0.35, 
+            "prefix_padding_ms": 300, 
+            "silence_duration_ms": 600
+        }
+    }
+})
+_COMMIT = orjson.dumps({"type": "input_audio_buffer.commit"})
+
+# input_audio_buffer.append envelope split around its payload. Base64 needs no
+# JSON escaping, so each chunk is spliced in instead of run through the encoder.
+_APPEND_HEAD, _APPEND_TAIL = orjson.dumps(
+    {"type": "input_audio_buffer.append", "audio": "__AUDIO__"}
+).split(b"__AUDIO__")
+
 class OpenAIRealtimeClient:
     def __init__(self, api_key, on_transcript, on_error):
         self.api_key = api_key
@@ -12,79 +60,130 @@ class OpenAIRealtimeClient:
         self.on_error = on_error
         self.ws = None
         self.loop = None
+        # Task running connect(); disconnect() cancels it wherever it is waiting
+        self._connect_task = None
         self._closing = False
+        # Background close handshakes, kept referenced until they finish
+        self._close_tasks = set()
+        # Audio waiting for the single sender task; exists from the start of
+        # connect, so audio captured during the handshake is kept
+        self._send_queue = None
         
         # Realtime API Config
         self.url = "wss://api.openai.com/v1/realtime?model=gpt-4o-realtime-preview-2024-10-01"
+        self._headers = {
+            "Authorization": f"Bearer {self.api_key}",
+            "OpenAI-Beta": "realtime=v1",
+        }
         
         # Latency & Deduplication
         self.audio_accumulated_sec = 0.0
         self.FORCE_COMMIT_INTERVAL = 3.0
+        self.MAX_BACKOFF_SEC = 30
+        self._established = False
         self.last_transcript = ""
         self.last_transcript_time = 0
 
     async def connect(self):
-        """Async connection loop."""
+        """Connection loop; reconnects with jittered exponential backoff until disconnect()."""
         self.loop = asyncio.get_running_loop()
+        self._connect_task = asyncio.current_task()
         self._closing = False
-        
-        headers = {
-            "Authorization": f"Bearer {self.api_key}",
-            "OpenAI-Beta": "realtime=v1",
-        }
-
-        print(f"🔗 Connecting to OpenAI Realtime API...")
+        # Created before the first handshake and kept across reconnects, so
+        # audio captured while (re)connecting is sent once the session is up
+        self._send_queue = asyncio.Queue(maxsize=32)
+        attempt = 0
 
         try:
-            async with websockets.connect(self.url, additional_headers=headers) as ws:
-                self.ws = ws
-                print("✅ Connected to OpenAI Realtime API")
-                
-                await self._send_session_update()
-
-                async for message in ws:
-                    if self._closing:
+            while not self._closing:
+                self._established = False
+                try:
+                    await self._run_session()
+                except websockets.exceptions.InvalidStatus as e:
+                    # Rejected credentials will not fix themselves; stop retrying
+                    if e.response.status_code in (401, 403):
+                        print(f"❌ OpenAI Connection Error: {e}")
+                        self.on_error(f"Connection failed: {e}")
                         break
-                    await self._handle_message(message)
+                    self._report_failure(e, attempt)
+                except Exception as e:
+                    # A session that came up ends any earlier failure streak, so
+                    # its own drop is reported as the first failure of a new one
+                    if self._established:
+                        attempt = 0
+                    self._report_failure(e, attempt)
+                if self._closing:
+                    break
+                if self._established:
+                    attempt = 0
+                delay = random.uniform(0.5, 1.0) * min(2 ** attempt, self.MAX_BACKOFF_SEC)
+                attempt += 1
+                print(f"🔁 Reconnecting to OpenAI in {delay:.1f}s...")
+                await asyncio.sleep(delay)
                     
         except asyncio.CancelledError:
             print("🔌 OpenAI connection cancelled")
-        except Exception as e:
-            if not self._closing:
-                print(f"❌ OpenAI Connection Error: {e}")
-                self.on_error(f"Connection failed: {e}")
         finally:
             self.ws = None
+            self._send_queue = None
             print("OpenAI Connection Closed")
 
+    def _report_failure(self, error, attempt):
+        if self._closing:
+            return
+        print(f"❌ OpenAI Connection Error: {error}")
+        # Only the first failure in a streak reaches the GUI
+        if attempt == 0:
+            self.on_error(f"Connection failed: {error}")
+
+    async def _run_session(self):
+        """One connection, from handshake until the socket closes."""
+        print(f"🔗 Connecting to OpenAI Realtime API...")
+
+        async with websockets.connect(
+            self.url, additional_headers=self._headers, ssl=_SSL_CONTEXT
+        ) as ws:
+            print("✅ Connected to OpenAI Realtime API")
+            
+            # send_audio_chunk only sees the socket once the session is
+            # configured, so no append can overtake session.update
+            await self._send_session_update(ws)
+            self.audio_accumulated_sec = 0.0
+            self.ws = ws
+            self._established = True
+            sender = asyncio.create_task(self._sender_loop(self._send_queue))
+
+            try:
+                while True:
+                    # decode=False hands over text frames as raw UTF-8;
+                    # the prefilter and orjson both work on bytes
+                    try:
+                        message = await ws.recv(decode=False)
+                    except websockets.exceptions.ConnectionClosedOK:
+                        break
+                    await self._handle_message(message)
+            finally:
+                sender.cancel()
+                self.ws = None
+
     async def disconnect(self):
+        """Drops the socket at once; the close handshake runs in the background."""
         self._closing = True
-        if self.ws:
-            try: await self.ws.close()
-            except: pass
-            self.ws = None
+        ws, self.ws = self.ws, None
+        if ws:
+            task = asyncio.create_task(self._safe_close(ws))
+            self._close_tasks.add(task)
+            task.add_done_callback(self._close_tasks.discard)
+        # Ends a pending recv or reconnect backoff immediately
+        if self._connect_task and not self._connect_task.done():
+            self._connect_task.cancel()
 
-    async def _send_session_update(self):
-        if not self.ws: return
-        
-        session_update = {
-            "type": "session.update",
-            "session": {
-                "modalities": ["text", "audio"],
-                "input_audio_format": "pcm16",
-                "input_audio_transcription": {
-                    "model": "whisper-1",
-                    "language": "en"
-                },
-                "turn_detection": {
-                    "type": "server_vad",
-                    "threshold": 0.35, 
-                    "prefix_padding_ms": 300, 
-                    "silence_duration_ms": 600
-                }
-            }
-        }
-        await self.ws.send(json.dumps(session_update))
+    async def _safe_close(self, ws):
+        try: await asyncio.wait_for(ws.close(), 5.0)
+        except: pass
+
+    async def _send_session_update(self, ws):
+        await ws.send(_SESSION_UPDATE, text=True)
         print("📤 Sent session config (Fast VAD 600ms, English)")
 
     def _is_duplicate(self, new_text):
@@ -110,8 +209,10 @@ class OpenAIRealtimeClient:
         return False
 
     async def _handle_message(self, message):
+        if not any(event in message for event in _HANDLED_EVENTS):
+            return
         try:
-            data = json.loads(message)
+            data = orjson.loads(message)
             event_type = data.get("type")
 
             if event_type == "conversation.item.input_audio_transcription.completed":
@@ -124,7 +225,7 @@ class OpenAIRealtimeClient:
                         self.last_transcript = cleaned
                         self.on_transcript(cleaned)
                     elif cleaned:
-                        print(f"♻️ Deduplicated: {cleaned}")
+                        logger.debug("Deduplicated: %s", cleaned)
             
             elif event_type == "conversation.item.input_audio_transcription.delta":
                 pass
@@ -153,16 +254,39 @@ class OpenAIRealtimeClient:
             return None
         return text
     
+    def queue_audio_chunk(self, audio_bytes):
+        """Thread-safe: hands a chunk to the sender task on the client's loop."""
+        if self._send_queue is None or self._closing:
+            return
+        try:
+            self.loop.call_soon_threadsafe(self._enqueue_audio, audio_bytes)
+        except RuntimeError:
+            pass  # Loop already closed
+
+    def _enqueue_audio(self, audio_bytes):
+        send_queue = self._send_queue
+        if send_queue is None:
+            return
+        if send_queue.full():
+            send_queue.get_nowait()  # Oldest audio is the least useful
+        send_queue.put_nowait(audio_bytes)
+
+    async def _sender_loop(self, send_queue):
+        """Only writer of audio; chunks that queued up during a send go out as one append."""
+        while True:
+            batch = [await send_queue.get()]
+            while not send_queue.empty():
+                batch.append(send_queue.get_nowait())
+            await self.send_audio_chunk(batch[0] if len(batch) == 1 else b"".join(batch))
+
     async def send_audio_chunk(self, audio_bytes):
         if self.ws and not self._closing:
             try:
                 # 1. Send Audio
-                encoded = base64.b64encode(audio_bytes).decode("utf-8")
-                append_event = {
-                    "type": "input_audio_buffer.append",
-                    "audio": encoded
-                }
-                await self.ws.send(json.dumps(append_event))
+                encoded = base64.b64encode(audio_bytes)
+                # The API only takes text frames; text=True sends the UTF-8
+                # bytes as one without a str round trip
+                await self.ws.send(b"".join((_APPEND_HEAD, encoded, _APPEND_TAIL)), text=True)
                 
                 # 2. Track Duration
                 duration = len(audio_bytes) / 48000.0
@@ -170,8 +294,7 @@ class OpenAIRealtimeClient:
                 
                 # 3. Force Commit if Threshold Exceeded
                 if self.audio_accumulated_sec >= self.FORCE_COMMIT_INTERVAL:
-                    commit_event = {"type": "input_audio_buffer.commit"}
-                    await self.ws.send(json.dumps(commit_event))
+                    await self.ws.send(_COMMIT, text=True)
                     self.audio_accumulated_sec = 0.0
                 
             except Exception as e:
@@ -0,0 +1,67 @@
+"""
+Prompt profiles for Gemini, loaded lazily by ConfigLoader.prompt.
+"""
+import functools
+
+PROMPT = """You are an expert scene analyzer providing real-time context for an AI assistant. You receive both video frames and audio transcriptions from the screen.
+
+YOUR JOB: Combine what you SEE and what you HEAR into a unified description of what's happening on screen.
+
+AUDIO TRANSCRIPTS (from the last few seconds):
+{audio_transcripts}
+
+ANALYSIS RULES:
+
+1. MATCH AUDIO TO VISUALS: When you see a character and hear dialogue, connect them. Example: "Charlie (blonde girl on screen) is singing 'Inside of every demon is a rainbow'"
+
+2. IDENTIFY SPEAKERS: Use visual cues to identify who is speaking or singing:
+   - If you recognize the character, use their name
+   - If not, describe them: "Pink-haired girl", "Man in red suit", "Female voice (off-screen)"
+
+3. AUDIO TYPES: Distinguish between:
+   - Character dialogue/singing (attribute to speaker)
+   - Background music (describe mood/style)
+   - Sound effects (describe what you hear)
+
+4. KEEP IT CONCISE: One short paragraph combining everything. The AI needs quick context, not a novel.
+
+OUTPUT FORMAT:
+Write a natural paragraph describing the scene. Include who's speaking/singing and what they said, what's visually happening, and any notable audio (music, SFX). Keep it under 100 words.
+
+EXAMPLE OUTPUT:
+"Charlie (blonde girl in white dress) is singing excitedly 'Inside of every demon is a rainbow!' while Vaggie stands behind her looking skeptical. Upbeat piano music playing. The hotel lobby is brightly lit with other demons watching in the background."
+
+NOW ANALYZE THE CURRENT SCENE:"""
+
+# Archived profiles and the name each has in old_prompts.py. That module is
+# only imported when one of them is picked, so the default never depends on it.
+ARCHIVED_PROFILES = {
+    "v2": "PROMPT2",
+    "v3": "PROMPT3",
+    "v4": "PROMPT4",
+}
+
+def load_profile(name):
+    """Returns the prompt for a profile, falling back to 'default'."""
+    if name == "default":
+        return PROMPT
+    if name in ARCHIVED_PROFILES:
+        try:
+            import old_prompts
+            return getattr(old_prompts, ARCHIVED_PROFILES[name])
+        except (ImportError, AttributeError) as e:
+            print(f"Warning: prompt profile '{name}' unavailable ({e}). Using 'default'.")
+            return PROMPT
+    print(f"Warning: unknown prompt profile '{name}'. Using 'default'.")
+    return PROMPT
+
+@functools.lru_cache(maxsize=None)
+def _prompt_parts(name):
+    return load_profile(name).partition("{audio_transcripts}")
+
+def render_prompt(name, audio_transcripts):
+    """Fills the {audio_transcripts} slot; each profile is split once, not re-parsed per call."""
+    prefix, slot, suffix = _prompt_parts(name)
+    if not slot:
+        return prefix
+    return prefix + audio_transcripts + suffix
@@ -1,7 +1,6 @@
 import threading
 import time
 import traceback
-from datetime import datetime
 
 class StreamingManager:
     def __init__(self, screen_capture, gemini_client, target_fps=1.0, restart_interval=1500, debug_mode=False):
@@ -68,7 +67,7 @@ class StreamingManager:
         Buffers the text to be sent alongside the next video frame.
         """
         with self.buffer_lock:
-            timestamp = datetime.now().strftime("%H:%M:%S")
+            timestamp = time.strftime("%H:%M:%S", time.localtime())
             # Format: [10:05:00] [USER]: Hello world
             entry = f"[{timestamp}] {text}"
             self.transcript_buffer.append(entry)
@@ -77,10 +76,11 @@ class StreamingManager:
 
     def _stream_loop(self):
         delay = 1.0 / self.target_fps
+        # Deadline for the next frame. A late frame goes out at once, but the
+        # deadline never falls more than one frame behind, so no burst follows.
+        next_frame = time.monotonic()
         
         while self.streaming_active and not self.stop_event.is_set():
-            start_time = time.time()
-            
             try:
                 # 1. Capture Frame
                 frame = self.screen_capture.capture_frame()
@@ -111,10 +111,9 @@ class StreamingManager:
                 if self.error_callback:
                     self.error_callback(f"Stream Loop Error: {e}")
 
-            # Maintain FPS
-            elapsed = time.time() - start_time
-            sleep_time = max(0, delay - elapsed)
-            time.sleep(sleep_time)
+            # Maintain FPS; waiting on the event lets stop_streaming return at once
+            next_frame = max(next_frame + delay, time.monotonic())
+            self.stop_event.wait(next_frame - time.monotonic())
 
     def _send_frame_to_gemini(self, frame_data, prompt_suffix=None):
         """
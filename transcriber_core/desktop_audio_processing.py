@@ -4,6 +4,7 @@ import time
 import numpy as np
 import soundfile as sf
 import re
+import traceback
 from threading import Thread
 from scipy import signal
 import torch
@@ -102,7 +103,6 @@ class AudioProcessor:
                 
         except Exception as e:
             print(f"Processing error: {str(e)}")
-            import traceback
             traceback.print_exc()
         finally:
             # Ensure the thread count is always decremented
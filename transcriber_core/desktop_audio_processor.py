@@ -1,6 +1,7 @@
 import os
 import time
 import re
+import traceback
 import numpy as np
 import soundfile as sf
 import sounddevice as sd
@@ -76,7 +77,6 @@ class AudioProcessor:
                     
         except Exception as e:
             print(f"Audio callback error: {e}")
-            import traceback
             traceback.print_exc()
             self.audio_buffer = np.array([], dtype=np.float32)
     
@@ -131,7 +131,6 @@ class AudioProcessor:
                 
         except Exception as e:
             print(f"Processing error: {str(e)}")
-            import traceback
             traceback.print_exc()
         finally:
             self.transcriber.active_threads -= 1
@@ -1,6 +1,8 @@
 import numpy as np
 import sounddevice as sd
 import asyncio
+import functools
+import itertools
 import threading
 from scipy import signal
 import queue
@@ -23,6 +25,10 @@ class SmartAudioTranscriber:
         self.process_thread = None
         self.network_thread = None
         self.loop = None
+        # Stops only the current capture thread; the OpenAI connection stays up.
+        # Each capture thread gets its own event, so a thread that outlives the
+        # join in switch_device still sees its stop request
+        self._capture_stop = threading.Event()
         
         # Audio Settings
         self.gain = 1.5
@@ -43,7 +49,20 @@ class SmartAudioTranscriber:
         self.loop = asyncio.new_event_loop()
         self.network_thread = threading.Thread(target=self._network_worker, args=(self.loop,), daemon=True)
         self.network_thread.start()
-        self.process_thread = threading.Thread(target=self._process_worker, daemon=True)
+        self.process_thread = threading.Thread(target=self._process_worker, args=(self._capture_stop,), daemon=True)
+        self.process_thread.start()
+
+    def switch_device(self, device_id):
+        """Restarts capture on another device, keeping the live OpenAI connection."""
+        self._capture_stop.set()
+        if self.process_thread and self.process_thread.is_alive():
+            self.process_thread.join(timeout=2.0)
+        self._capture_stop = threading.Event()
+        self.device_id = device_id
+        with self.queue.mutex:
+            self.queue.queue.clear()
+            self.queue.not_full.notify_all()
+        self.process_thread = threading.Thread(target=self._process_worker, args=(self._capture_stop,), daemon=True)
         self.process_thread.start()
 
     def stop(self):
@@ -95,7 +114,7 @@ class SmartAudioTranscriber:
             except:
                 pass
 
-    def _audio_callback(self, indata, frames, time_info, status):
+    def _audio_callback(self, slots, indata, frames, time_info, status):
         """Audio callback with volume reporting."""
         if not self.running:
             return
@@ -107,12 +126,15 @@ class SmartAudioTranscriber:
         if self.volume_callback:
             self.volume_callback(min(1.0, rms_val * 10))
             
+        # Copy into the next preallocated slot instead of allocating per callback
+        slot = next(slots)
+        np.copyto(slot, indata)
         try:
-            self.queue.put_nowait(indata.copy())
+            self.queue.put_nowait(slot)
         except queue.Full:
             try:
                 self.queue.get_nowait()
-                self.queue.put_nowait(indata.copy())
+                self.queue.put_nowait(slot)
             except:
                 pass
 
@@ -131,39 +153,47 @@ class SmartAudioTranscriber:
             db = -100 
         return db
 
-    def _process_worker(self):
+    def _process_worker(self, stop_event):
+        # Device and rate stay local, so a thread that exits late never picks up
+        # the next device's settings
+        device_id = self.device_id
         try:
-            dev_info = sd.query_devices(self.device_id, 'input')
-            self.input_rate = int(dev_info['default_samplerate'])
+            dev_info = sd.query_devices(device_id, 'input')
+            input_rate = int(dev_info['default_samplerate'])
             device_name = dev_info['name']
         except Exception as e:
-            print(f"⚠️ Could not query device {self.device_id}: {e}")
-            self.input_rate = 48000
-            device_name = f"Device {self.device_id}"
+            print(f"⚠️ Could not query device {device_id}: {e}")
+            input_rate = 48000
+            device_name = f"Device {device_id}"
+        self.input_rate = input_rate
             
         print(f"🎧 OpenAI Audio: {device_name}")
-        print(f"   Rate: {self.input_rate}Hz → {self.target_rate}Hz | Server VAD enabled")
+        print(f"   Rate: {input_rate}Hz → {self.target_rate}Hz | Server VAD enabled")
 
-        time.sleep(2.0)
-        samples_per_chunk = int(self.input_rate * self.chunk_duration_ms / 1000)
+        samples_per_chunk = int(input_rate * self.chunk_duration_ms / 1000)
         
         retry_count = 0
         max_retries = 5
         
-        while self.running and retry_count < max_retries:
+        while self.running and not stop_event.is_set() and retry_count < max_retries:
             try:
-                self._run_audio_stream(samples_per_chunk)
+                self._run_audio_stream(device_id, input_rate, samples_per_chunk, stop_event)
                 break
             except Exception as e:
                 if not self.running: break
                 retry_count += 1
                 print(f"⚠️ Audio error (attempt {retry_count}/{max_retries}): {e}")
-                time.sleep(2.0)
+                stop_event.wait(2.0)
 
-    def _run_audio_stream(self, samples_per_chunk):
+    def _run_audio_stream(self, device_id, input_rate, samples_per_chunk, stop_event):
+        # blocksize is fixed, so every callback fits one slot. Two spare slots
+        # past the queue size keep a full queue from aliasing the slot being written.
+        # The pool belongs to this stream alone.
+        pool = np.empty((self.queue.maxsize + 2, samples_per_chunk, 1), dtype=np.int16)
+        slots = itertools.cycle(pool)
         with sd.InputStream(
-            device=self.device_id, channels=1, samplerate=self.input_rate, 
-            callback=self._audio_callback, blocksize=samples_per_chunk,
+            device=device_id, channels=1, samplerate=input_rate, 
+            callback=functools.partial(self._audio_callback, slots), blocksize=samples_per_chunk,
             dtype='int16', latency='low'
         ) as stream:
             print(f"✅ OpenAI Audio Stream Active (Server VAD mode)")
@@ -172,23 +202,30 @@ class SmartAudioTranscriber:
             audio_buffer = np.array([], dtype=np.float32)
             
             send_interval = 1.2
-            last_send_time = time.time()
-            min_samples_to_send = int(self.input_rate * send_interval)
+            min_samples_to_send = int(input_rate * send_interval)
+            # Token bucket: one chunk per interval on average, with room for a
+            # short burst so a backlog drains instead of growing toward the cap
+            bucket_capacity = 3.0
+            tokens = 1.0
+            last_refill = time.monotonic()
             
-            while self.running:
-                # Collect audio from queue
-                while not self.queue.empty():
-                    try:
-                        data = self.queue.get_nowait()
-                        float_chunk = data.flatten().astype(np.float32) / 32768.0
-                        audio_buffer = np.concatenate([audio_buffer, float_chunk])
-                    except queue.Empty: 
-                        break
+            while self.running and not stop_event.is_set():
+                # Collect audio from queue (one lock acquisition for the whole backlog)
+                with self.queue.mutex:
+                    chunks = list(self.queue.queue)
+                    self.queue.queue.clear()
+                    self.queue.not_full.notify_all()
+                if chunks:
+                    float_chunk = np.concatenate(chunks).flatten().astype(np.float32) / 32768.0
+                    audio_buffer = np.concatenate([audio_buffer, float_chunk])
                 
-                current_time = time.time()
+                now = time.monotonic()
+                tokens = min(bucket_capacity, tokens + (now - last_refill) / send_interval)
+                last_refill = now
                 
                 # Send audio at regular intervals
-                if current_time - last_send_time >= send_interval and len(audio_buffer) >= min_samples_to_send:
+                while tokens >= 1.0 and len(audio_buffer) >= min_samples_to_send:
+                    tokens -= 1.0
                     # Process the audio
                     audio_to_send = audio_buffer[:min_samples_to_send].copy()
                     audio_buffer = audio_buffer[min_samples_to_send:]
@@ -202,19 +239,14 @@ class SmartAudioTranscriber:
                     db_level = self._calculate_db(audio_to_send)
                     if db_level >= self.db_threshold:
                         # Resample to 24kHz for OpenAI
-                        resampled = self._resample(audio_to_send, self.input_rate, self.target_rate)
-                        pcm_bytes = (resampled * 32767).astype(np.int16).tobytes()
+                        resampled = self._resample(audio_to_send, input_rate, self.target_rate)
+                        # b64encode reads the array's buffer directly; no tobytes() copy
+                        pcm_bytes = memoryview((resampled * 32767).astype(np.int16)).cast('B')
                         
-                        if self.loop and self.loop.is_running():
-                            asyncio.run_coroutine_threadsafe(
-                                self.client.send_audio_chunk(pcm_bytes), 
-                                self.loop
-                            )
-                    
-                    last_send_time = current_time
+                        self.client.queue_audio_chunk(pcm_bytes)
                 
                 # Prevent buffer from growing too large
-                max_buffer = int(self.input_rate * 5)  # Max 5 seconds
+                max_buffer = int(input_rate * 5)  # Max 5 seconds
                 if len(audio_buffer) > max_buffer:
                     audio_buffer = audio_buffer[-max_buffer:]
                 
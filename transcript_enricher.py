@@ -1,9 +1,15 @@
 import asyncio
-import json
+import re
 import time
 import threading
 from openai import OpenAI
 
+# Same for every request, so it is built once
+_SYSTEM_MESSAGE = {"role": "system", "content": "You are a transcript formatter. Output only the formatted line."}
+
+# Speaker name in an enriched line such as "[1:05] Male Voice 1 (calm): ..."
+SPEAKER_PATTERN = re.compile(r'\[\d+:\d+\]\s*(?:\[.*?\]\s*)?([^:(]+?)(?:\s*\([^)]+\))?:')
+
 class TranscriptEnricher:
     """
     Takes raw Whisper transcriptions and enriches them with:
@@ -27,8 +33,8 @@ class TranscriptEnricher:
         self.known_speakers = {}  # Maps descriptions to consistent labels
         self.speaker_counter = {"female": 0, "male": 0, "unknown": 0}
         
-        # Track timing
-        self.session_start = time.time()
+        # Track timing (monotonic, so clock adjustments cannot skew timestamps)
+        self.session_start_ns = time.monotonic_ns()
         
         # Processing queue
         self.queue = []
@@ -39,7 +45,7 @@ class TranscriptEnricher:
     def start(self):
         """Start the enrichment processor."""
         self.running = True
-        self.session_start = time.time()
+        self.session_start_ns = time.monotonic_ns()
         self.known_speakers = {}
         self.speaker_counter = {"female": 0, "male": 0, "unknown": 0}
         self.process_thread = threading.Thread(target=self._process_loop, daemon=True)
@@ -61,7 +67,7 @@ class TranscriptEnricher:
         if not raw_transcript or len(raw_transcript.strip()) < 2:
             return
             
-        timestamp = time.time() - self.session_start
+        timestamp = (time.monotonic_ns() - self.session_start_ns) // 1_000_000_000
         
         with self.lock:
             self.queue.append({
@@ -94,9 +100,8 @@ class TranscriptEnricher:
                 time.sleep(0.1)
     
     def _format_timestamp(self, seconds):
-        """Format seconds as M:SS."""
-        mins = int(seconds // 60)
-        secs = int(seconds % 60)
+        """Format whole seconds as M:SS."""
+        mins, secs = divmod(seconds, 60)
         return f"{mins}:{secs:02d}"
     
     def _get_speaker_history(self):
@@ -150,10 +155,7 @@ OUTPUT:"""
         try:
             response = self.client.chat.completions.create(
                 model="gpt-4o",
-                messages=[
-                    {"role": "system", "content": "You are a transcript formatter. Output only the formatted line."},
-                    {"role": "user", "content": prompt}
-                ],
+                messages=[_SYSTEM_MESSAGE, {"role": "user", "content": prompt}],
                 max_tokens=250,
                 temperature=0.3
             )
@@ -172,8 +174,7 @@ OUTPUT:"""
             return f"[{timestamp}] {raw_text}"
     
     def _track_speaker(self, enriched_line):
-        import re
-        match = re.search(r'\[\d+:\d+\]\s*(?:\[.*?\]\s*)?([^:(]+?)(?:\s*\([^)]+\))?:', enriched_line)
+        match = SPEAKER_PATTERN.search(enriched_line)
         if match:
             speaker = match.group(1).strip()
             if any(x in speaker.lower() for x in ['female', 'male', 'voice', 'singer', 'girl', 'boy', 'woman', 'man']):
@@ -1,5 +1,5 @@
 import asyncio
-import json
+import orjson  # type: ignore
 import threading
 import websockets  # type: ignore
 import time
@@ -7,6 +7,22 @@ import queue
 
 WEBSOCKET_PORT = 8003
 
+
+def _heartbeat():
+    return orjson.dumps({"type": "heartbeat", "status": "active", "timestamp": time.time()}).decode()
+
+
+def _pong():
+    return orjson.dumps({"type": "pong", "timestamp": time.time()}).decode()
+
+
+def _welcome():
+    return orjson.dumps({
+        "type": "connection_established",
+        "message": "Connected to Gemini Screen Watcher WebSocket",
+        "timestamp": time.time()
+    }).decode()
+
 class WebSocketServer:
     """Manages a WebSocket server to broadcast data to clients."""
 
@@ -17,6 +33,8 @@ class WebSocketServer:
         self.running = True
         # NEW: Thread-safe message queue
         self.message_queue = queue.Queue()
+        # Set from broadcast() to wake the queue processor; created on the server loop
+        self._wakeup = None
 
     def start(self):
         """Starts the WebSocket server in a new thread."""
@@ -43,13 +61,20 @@ class WebSocketServer:
 
     async def _start_server(self):
         """The main async task that starts the websockets server."""
+        self._wakeup = asyncio.Event()
+
         # Start the queue processor
         processor_task = asyncio.create_task(self._process_message_queue())
         
         # Start heartbeat
         heartbeat_task = asyncio.create_task(self._heartbeat_loop())
         
-        async with websockets.serve(self._connection_handler, "localhost", WEBSOCKET_PORT):
+        # Clients are local, so deflate would only cost CPU on every broadcast.
+        # They only ever send pings, so a small max_size is plenty.
+        async with websockets.serve(
+            self._connection_handler, "localhost", WEBSOCKET_PORT,
+            compression=None, max_size=64 * 1024
+        ):
             await asyncio.Future()  # Run forever
 
     async def _heartbeat_loop(self):
@@ -57,23 +82,21 @@ class WebSocketServer:
         while self.running:
             await asyncio.sleep(5)
             if self.running and self.connected_clients:
-                await self._do_broadcast({
-                    "type": "heartbeat",
-                    "timestamp": time.time(),
-                    "status": "active"
-                })
+                self._send_to_all(_heartbeat())
 
     async def _process_message_queue(self):
-        """Continuously processes messages from the thread-safe queue."""
+        """Drains the thread-safe queue whenever broadcast() signals new messages."""
         while self.running:
             try:
-                # Check for messages with a small timeout
-                try:
-                    data = self.message_queue.get_nowait()
-                    await self._do_broadcast(data)
-                except queue.Empty:
-                    pass
-                await asyncio.sleep(0.01)  # Small delay to prevent busy-waiting
+                # Clearing before the drain means a message queued mid-drain re-arms it
+                self._wakeup.clear()
+                while True:
+                    try:
+                        data = self.message_queue.get_nowait()
+                    except queue.Empty:
+                        break
+                    self._do_broadcast(data)
+                await self._wakeup.wait()
             except Exception as e:
                 print(f"Queue processor error: {e}")
 
@@ -84,22 +107,16 @@ class WebSocketServer:
         print(f"New AI client connected. Total clients: {client_count}")
         
         try:
-            welcome_message = {
-                "type": "connection_established",
-                "timestamp": time.time(),
-                "message": "Connected to Gemini Screen Watcher WebSocket"
-            }
-            await websocket.send(json.dumps(welcome_message))
+            await websocket.send(_welcome())
             
             async for message in websocket:
+                # Pings are the only message acted on; skip parsing anything else
+                if (b'"ping"' if isinstance(message, bytes) else '"ping"') not in message:
+                    continue
                 try:
-                    data = json.loads(message)
+                    data = orjson.loads(message)
                     if data.get("type") == "ping":
-                        response = {
-                            "type": "pong",
-                            "timestamp": time.time()
-                        }
-                        await websocket.send(json.dumps(response))
+                        await websocket.send(_pong())
                 except Exception as e:
                     print(f"Error handling message: {e}")
                     
@@ -111,33 +128,34 @@ class WebSocketServer:
             self.connected_clients.discard(websocket)
             print(f"Client removed. Total clients: {len(self.connected_clients)}")
 
-    async def _do_broadcast(self, data):
+    def _do_broadcast(self, data):
         """Actually sends data to all connected clients."""
         if not self.connected_clients:
             return
-            
-        message = json.dumps(data)
-        dead_clients = set()
-        
-        for client in self.connected_clients.copy():
-            try:
-                await client.send(message)
-            except websockets.exceptions.ConnectionClosed:
-                dead_clients.add(client)
-            except Exception as e:
-                print(f"Broadcast error to client: {e}")
-                dead_clients.add(client)
-        
-        # Clean up dead clients
-        for client in dead_clients:
-            self.connected_clients.discard(client)
+        # Transcriber confidences can be numpy scalars; clients read text frames
+        self._send_to_all(orjson.dumps(data, option=orjson.OPT_SERIALIZE_NUMPY).decode())
+
+    def _send_to_all(self, message):
+        """
+        Writes an already-encoded message to every client without awaiting
+        each send, so one slow client cannot hold up the others. Closed
+        connections are skipped; _connection_handler removes them.
+        """
+        websockets.broadcast(self.connected_clients, message)
 
     def broadcast(self, data):
         """Thread-safe method to queue a message for broadcast."""
+        # No listeners: skip the queue and the cross-thread wakeup entirely
+        if not self.connected_clients:
+            return
         try:
             self.message_queue.put_nowait(data)
+            if self._wakeup is not None:
+                self.loop.call_soon_threadsafe(self._wakeup.set)
             # DEBUG: Uncomment to verify broadcasts are being queued
             # msg_type = data.get('type', 'unknown')
             # print(f"📤 [WS] Queued: {msg_type}")
         except queue.Full:
-            print("⚠️ [WS] Message queue full, dropping message")
\ No newline at end of file
+            print("⚠️ [WS] Message queue full, dropping message")
+        except RuntimeError:
+            pass  # Server loop already closed
\ No newline at end of file